@@ -113,6 +113,7 @@ def install_dependencies(pip_executable):
         
         # Install build tools
         run_command([pip_executable, "install", "pyinstaller", "setuptools", "wheel"])
+        run_command([pip_executable, "install", "-r", "requirements-build.txt"])
         
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] Dependency installation failed: {e}")
@@ -122,6 +123,7 @@ def install_dependencies(pip_executable):
             run_command(["pip", "install", "--upgrade", "pip"])
             run_command(["pip", "install", "-r", "requirements.txt"])
             run_command(["pip", "install", "pyinstaller", "setuptools", "wheel"])
+            run_command(["pip", "install", "-r", "requirements-build.txt"])
 
 def clean_build_artifacts():
     """Clean previous build artifacts"""
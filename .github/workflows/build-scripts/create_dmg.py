@@ -1,17 +1,38 @@
 #!/usr/bin/env python3
 """
 Enhanced DMG creation script for macOS with custom branding
+
+Branded DMGs are built in-process with dmgbuild (installed on macOS from
+requirements-build.txt) when it is available; otherwise, or with --legacy, the
+hdiutil/AppleScript pipeline is used.
 """
 
 import os
 import sys
+import hashlib
 import subprocess
+import time
 import shutil
+import platform
+from functools import lru_cache
 from pathlib import Path
 
-def run_command(cmd, check=True):
-    """Run a command and return the result"""
+try:
+    import dmgbuild
+except ImportError:
+    dmgbuild = None
+
+def run_command(cmd, check=True, stream=False):
+    """Run a command and return the result
+    
+    With stream=True the output goes straight to our stdout/stderr instead of
+    being captured, so result.stdout is not available.
+    """
     print(f"Running: {' '.join(cmd) if isinstance(cmd, list) else cmd}")
+    if stream:
+        sys.stdout.flush()
+        return subprocess.run(cmd, shell=isinstance(cmd, str), check=check)
+    
     result = subprocess.run(cmd, shell=isinstance(cmd, str), check=check, capture_output=True, text=True)
     
     if result.stdout:
@@ -21,29 +42,117 @@ def run_command(cmd, check=True):
     
     return result
 
-def create_branded_dmg(executable_path, output_path):
-    """Create a branded DMG with custom icon and layout"""
+def clone_file(src, dst):
+    """Copy a file, using an APFS clone (copy-on-write) when possible"""
+    result = subprocess.run(["cp", "-c", str(src), str(dst)], capture_output=True)
+    if result.returncode != 0:
+        # Not APFS (or no clone support) - fall back to the fcopyfile fast path
+        shutil.copyfile(src, dst)
+        shutil.copystat(src, dst)
+
+@lru_cache(maxsize=None)
+def compressed_dmg_format():
+    """Pick the fastest compressed DMG format this macOS supports"""
+    # LZFSE (ULFO) is much faster to compress than zlib and needs 10.11+
+    release = platform.mac_ver()[0]
+    try:
+        version = tuple(int(part) for part in release.split(".")[:2])
+    except ValueError:
+        version = ()
+    return "ULFO" if version >= (10, 11) else "UDZO"
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """SHA-256 of a file, read in chunks (hashlib.file_digest needs 3.11+)"""
+    hash_obj = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            hash_obj.update(chunk)
+    return hash_obj.hexdigest()
+
+def is_release_build():
+    """Check whether we are building for a release tag in CI"""
+    return os.environ.get("GITHUB_REF", "").startswith("refs/tags/")
+
+def build_dmg_in_process(dmg_temp_dir, app_name, output_path):
+    """Build the branded DMG with dmgbuild instead of shelling out"""
+    settings = {
+        "format": compressed_dmg_format(),
+        "files": [str(dmg_temp_dir / app_name), str(dmg_temp_dir / "README.txt")],
+        "symlinks": {"Applications": "/Applications"},
+        "icon": str(dmg_temp_dir / ".VolumeIcon.icns"),
+        "default_view": "icon-view",
+        "show_toolbar": False,
+        "show_status_bar": False,
+        "window_rect": ((100, 100), (500, 300)),
+        "arrange_by": None,
+        "icon_size": 128,
+        "icon_locations": {
+            app_name: (150, 200),
+            "Applications": (350, 200),
+        },
+    }
+    dmgbuild.build_dmg(str(output_path), "Mitotic Spindle Tool", settings=settings)
+
+def dmg_build_mode(branded, legacy):
+    """Name the pipeline create_branded_dmg will use for these options"""
+    if not branded:
+        return "fast"
+    if dmgbuild is not None and not legacy:
+        return "dmgbuild"
+    return "hdiutil"
+
+def create_branded_dmg(executable_path, output_path, branded=True, legacy=False):
+    """Create a branded DMG with custom icon and layout
+    
+    With branded=False the cosmetic mount/AppleScript/convert pass is skipped
+    and a compressed DMG is written directly in a single hdiutil call.
+    With legacy=True the hdiutil/AppleScript pipeline is used even when
+    dmgbuild is installed.
+    
+    The build is skipped if the DMG already exists and was made from the
+    same executable by the same pipeline. This is recorded in a hidden stamp
+    file next to the DMG, so artifact listings skip it.
+    """
     
     if not Path(executable_path).exists():
         print(f"[ERROR] Executable not found: {executable_path}")
         return False
     
+    output = Path(output_path)
+    stamp_path = output.with_name(f".{output.name}.stamp")
+    
+    def make_stamp():
+        digest = file_sha256(executable_path)
+        return f"{digest} {output.name} {dmg_build_mode(branded, legacy)}\n"
+    
+    # Only hash the executable when there is a stamp to compare against
+    if output.exists() and stamp_path.exists() and stamp_path.read_text() == make_stamp():
+        print(f"[INFO] {output_path} is up to date, skipping DMG creation")
+        return True
+    
+    # Drop the old stamp first so a failed rebuild cannot leave it behind
+    if stamp_path.exists():
+        stamp_path.unlink()
+    
+    success = _build_dmg(executable_path, output_path, branded, legacy)
+    if success:
+        stamp_path.write_text(make_stamp())
+    return success
+
+def _build_dmg(executable_path, output_path, branded, legacy):
+    """Stage the DMG contents and build the image"""
+    
     # Create temporary directory for DMG contents
     dmg_temp_dir = Path("dist/dmg_temp")
     dmg_temp_dir.mkdir(parents=True, exist_ok=True)
     
     try:
-        # Copy executable
+        # Copy executable (mode bits are preserved by the clone/copystat)
         app_name = "Mitotic Spindle Tool"
-        shutil.copy2(executable_path, dmg_temp_dir / app_name)
-        
-        # Make executable
-        os.chmod(dmg_temp_dir / app_name, 0o755)
+        clone_file(executable_path, dmg_temp_dir / app_name)
         
-        # Copy application icon if available
-        icon_512 = Path("icons/EltingLabSpindle_512x512.png")
-        if icon_512.exists():
-            shutil.copy2(icon_512, dmg_temp_dir / ".VolumeIcon.icns")
+        # Copy the pre-built volume icon
+        shutil.copyfile("icons/EltingLabSpindle.icns", dmg_temp_dir / ".VolumeIcon.icns")
         
         # Create Applications symlink for easy installation
         applications_link = dmg_temp_dir / "Applications"
@@ -67,6 +176,33 @@ Developed by the Elting Lab.
         with open(dmg_temp_dir / "README.txt", "w") as f:
             f.write(readme_content)
         
+        if Path(output_path).exists():
+            Path(output_path).unlink()
+        
+        if not branded:
+            # Fast path: write the compressed DMG in one go
+            print("Creating DMG (fast mode)...")
+            run_command([
+                "hdiutil", "create",
+                "-volname", "Mitotic Spindle Tool",
+                "-srcfolder", str(dmg_temp_dir),
+                "-ov", "-format", "UDZO",
+                "-imagekey", "zlib-level=1",
+                str(output_path)
+            ], stream=True)
+            shutil.rmtree(dmg_temp_dir)
+            
+            print(f"[SUCCESS] Created DMG: {output_path}")
+            return True
+        
+        if dmg_build_mode(branded, legacy) == "dmgbuild":
+            print("Creating DMG with dmgbuild...")
+            build_dmg_in_process(dmg_temp_dir, app_name, output_path)
+            shutil.rmtree(dmg_temp_dir)
+            
+            print(f"[SUCCESS] Created branded DMG: {output_path}")
+            return True
+        
         # Create DMG with custom settings
         print("Creating DMG...")
         
@@ -81,37 +217,18 @@ Developed by the Elting Lab.
             "-srcfolder", str(dmg_temp_dir),
             "-ov", "-format", "UDRW",  # Read-write format for customization
             str(temp_dmg)
-        ])
+        ], stream=True)
         
         # Mount the DMG for customization
         print("Mounting DMG for customization...")
-        mount_result = run_command([
-            "hdiutil", "attach", str(temp_dmg), "-mountpoint", "/Volumes/MitoticSpindleTool"
-        ])
+        run_command([
+            "hdiutil", "attach", str(temp_dmg), "-mountpoint", "/Volumes/MitoticSpindleTool",
+            "-noverify", "-noautoopen"
+        ], stream=True)
         
         try:
-            # Set custom icon for the volume (requires macOS)
-            if icon_512.exists():
-                try:
-                    # Convert PNG to icns
-                    icns_path = dmg_temp_dir / "VolumeIcon.icns"
-                    run_command([
-                        "sips", "-s", "format", "icns", str(icon_512), "--out", str(icns_path)
-                    ], check=False)
-                    
-                    # Copy icon to mounted volume
-                    if icns_path.exists():
-                        shutil.copy2(icns_path, "/Volumes/MitoticSpindleTool/.VolumeIcon.icns")
-                        
-                        # Set volume icon attribute
-                        run_command([
-                            "SetFile", "-a", "C", "/Volumes/MitoticSpindleTool"
-                        ], check=False)
-                        
-                except subprocess.CalledProcessError:
-                    print("[INFO] Could not set volume icon (optional)")
-            
-            # Set custom view options (requires AppleScript on macOS)
+            # Set custom view options and flag the volume as having a custom
+            # icon in a single osascript call (requires AppleScript on macOS)
             applescript = f'''
             tell application "Finder"
                 tell disk "Mitotic Spindle Tool"
@@ -127,31 +244,36 @@ Developed by the Elting Lab.
                     close
                     open
                     update without registering applications
-                    delay 2
                 end tell
             end tell
+            try
+                do shell script "/usr/bin/SetFile -a C /Volumes/MitoticSpindleTool"
+            end try
             '''
             
             try:
-                run_command(["osascript", "-e", applescript], check=False)
+                run_command(["osascript", "-e", applescript], check=False, stream=True)
             except subprocess.CalledProcessError:
                 print("[INFO] Could not set DMG layout (optional)")
             
+            # Give Finder a moment to write the layout (.DS_Store) to disk
+            ds_store = Path("/Volumes/MitoticSpindleTool/.DS_Store")
+            deadline = time.monotonic() + 1.0
+            while not ds_store.exists() and time.monotonic() < deadline:
+                time.sleep(0.05)
+            
         finally:
             # Unmount the DMG
             print("Unmounting DMG...")
-            run_command(["hdiutil", "detach", "/Volumes/MitoticSpindleTool"], check=False)
+            run_command(["hdiutil", "detach", "/Volumes/MitoticSpindleTool"], check=False, stream=True)
         
         # Convert to final compressed DMG
         print("Creating final compressed DMG...")
-        if Path(output_path).exists():
-            Path(output_path).unlink()
-            
         run_command([
             "hdiutil", "convert", str(temp_dmg),
-            "-format", "UDZO",  # Compressed format
+            "-format", compressed_dmg_format(),  # Compressed format
             "-o", str(output_path)
-        ])
+        ], stream=True)
         
         # Clean up
         if temp_dmg.exists():
@@ -168,12 +290,25 @@ Developed by the Elting Lab.
         return False
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python create_dmg.py <executable_path> <output_dmg_path>")
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    flags = [arg for arg in sys.argv[1:] if arg.startswith("--")]
+    
+    if len(args) != 2 or any(flag not in ("--branded", "--fast", "--legacy") for flag in flags):
+        print("Usage: python create_dmg.py [--branded | --fast] [--legacy] <executable_path> <output_dmg_path>")
+        print("  By default the branded layout is only applied for release tags")
+        print("  --legacy uses hdiutil/AppleScript even if dmgbuild is installed")
         sys.exit(1)
     
-    executable = sys.argv[1]
-    output = sys.argv[2]
+    executable = args[0]
+    output = args[1]
+    
+    if "--branded" in flags:
+        branded = True
+    elif "--fast" in flags:
+        branded = False
+    else:
+        branded = is_release_build()
     
-    success = create_branded_dmg(executable, output)
+    success = create_branded_dmg(executable, output, branded=branded,
+                                 legacy="--legacy" in flags)
     sys.exit(0 if success else 1)
@@ -8,10 +8,22 @@ import os
 import sys
 import hashlib
 import json
+import mmap
 import platform
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
 # Add src to path for version import
 sys.path.insert(0, 'src')
 try:
@@ -22,28 +34,59 @@ except ImportError:
     VERSION_DISPLAY = "unknown"
 
 
-def calculate_checksum(file_path, algorithm='sha256'):
-    """Calculate checksum for a file."""
-    hash_obj = hashlib.new(algorithm)
+def new_hash(algorithm):
+    """Create a hash object, including BLAKE3 which hashlib does not provide."""
+    if algorithm == 'blake3':
+        return blake3.blake3()
+    return hashlib.new(algorithm)
+
+
+def multi_checksum(file_path, algs=('sha256',), size=None):
+    """Calculate several checksums for a file in a single read pass.
+    
+    The file is memory-mapped and every hash is fed the whole mapping at once.
+    If the file size is already known it can be passed in so empty files
+    are hashed without being opened.
+    """
+    hashes = {alg: new_hash(alg) for alg in algs}
+    if size == 0:
+        return {alg: hash_obj.hexdigest() for alg, hash_obj in hashes.items()}
     
     try:
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_obj.update(chunk)
-        return hash_obj.hexdigest()
-    except FileNotFoundError:
+            # mmap rejects empty files; the file may have been truncated
+            # since its size was read, so check it again
+            if os.fstat(f.fileno()).st_size > 0:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    for hash_obj in hashes.values():
+                        hash_obj.update(view)
+        return {alg: hash_obj.hexdigest() for alg, hash_obj in hashes.items()}
+    except (OSError, ValueError):
         return None
 
 
-def get_file_size(file_path):
-    """Get file size in bytes."""
+CHECKSUM_CACHE = ".checksum_cache.json"
+
+
+def load_checksum_cache(cache_file):
+    """Load cached checksums from a previous run, if any."""
     try:
-        return os.path.getsize(file_path)
-    except FileNotFoundError:
-        return None
+        with open(cache_file, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
 
 
-def generate_metadata(dist_dir="dist"):
+def save_checksum_cache(cache, cache_file):
+    """Persist cached checksums for the next run."""
+    try:
+        with open(cache_file, 'w') as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    except OSError as e:
+        print(f"Warning: Could not save checksum cache: {e}")
+
+
+def generate_metadata(dist_dir="dist", algs=('sha256',)):
     """Generate build metadata for all artifacts in dist directory."""
     
     dist_path = Path(dist_dir)
@@ -75,24 +118,52 @@ def generate_metadata(dist_dir="dist"):
         "artifacts": {}
     }
     
-    # Process all files in dist directory
-    for file_path in dist_path.iterdir():
-        if file_path.is_file():
-            filename = file_path.name
-            
+    # Process all files in dist directory, hashing them concurrently
+    # (scandir entries cache their stat result, so no extra syscalls)
+    # Hidden files such as the checksum cache are not release artifacts
+    with os.scandir(dist_path) as it:
+        files = [(entry.path, entry.name, entry.stat().st_size, entry.stat().st_mtime_ns)
+                 for entry in it
+                 if entry.is_file() and not entry.name.startswith(".")]
+    
+    # Reuse checksums of artifacts that are unchanged since the last run
+    cache_file = dist_path / CHECKSUM_CACHE
+    cache = load_checksum_cache(cache_file)
+    results = {}
+    to_hash = []
+    for file_path, filename, size, mtime_ns in files:
+        cached = cache.get(filename)
+        if (cached and cached["size"] == size and cached["mtime_ns"] == mtime_ns
+                and all(alg in cached["checksums"] for alg in algs)):
+            results[filename] = {alg: cached["checksums"][alg] for alg in algs}
+        else:
+            to_hash.append((file_path, filename, size, mtime_ns))
+    
+    if to_hash:
+        with ThreadPoolExecutor(max_workers=min(8, len(to_hash))) as executor:
+            hashed = executor.map(lambda f: multi_checksum(f[0], algs, size=f[2]), to_hash)
+            for (file_path, filename, size, mtime_ns), checksums in zip(to_hash, hashed):
+                results[filename] = checksums
+                if checksums:
+                    cache[filename] = {"size": size, "mtime_ns": mtime_ns, "checksums": checksums}
+    
+    # Only keep cache entries for artifacts that still exist
+    save_checksum_cache({name: cache[name] for name in results if name in cache}, cache_file)
+    
+    for file_path, filename, size, mtime_ns in files:
+        checksums = results[filename]
+        
+        # Only include if we successfully got checksums
+        if checksums:
             file_info = {
                 "filename": filename,
-                "size_bytes": get_file_size(file_path),
-                "sha256": calculate_checksum(file_path, 'sha256'),
-                "md5": calculate_checksum(file_path, 'md5')
+                "size_bytes": size,
+                **checksums
             }
-            
-            # Only include if we successfully got checksums
-            if file_info["sha256"] and file_info["md5"]:
-                metadata["artifacts"][filename] = file_info
-                print(f"✓ Processed {filename} ({file_info['size_bytes']} bytes)")
-            else:
-                print(f"⚠ Skipped {filename} (could not read)")
+            metadata["artifacts"][filename] = file_info
+            print(f"✓ Processed {filename} ({file_info['size_bytes']} bytes)")
+        else:
+            print(f"⚠ Skipped {filename} (could not read)")
     
     return metadata
 
@@ -100,8 +171,13 @@ def generate_metadata(dist_dir="dist"):
 def save_metadata(metadata, output_file="build_metadata.json"):
     """Save metadata to JSON file."""
     try:
-        with open(output_file, 'w') as f:
-            json.dump(metadata, f, indent=2, sort_keys=True)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+        else:
+            # Same bytes as orjson: UTF-8 text rather than \u escapes
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f, indent=2, sort_keys=True, ensure_ascii=False)
         print(f"✓ Metadata saved to {output_file}")
         return True
     except Exception as e:
@@ -121,7 +197,11 @@ def generate_checksums_text(metadata, output_file="CHECKSUMS.txt"):
                 f.write(f"## {filename}\n")
                 f.write(f"Size: {info['size_bytes']:,} bytes\n")
                 f.write(f"SHA256: {info['sha256']}\n")
-                f.write(f"MD5: {info['md5']}\n\n")
+                if 'blake3' in info:
+                    f.write(f"BLAKE3: {info['blake3']}\n")
+                if 'md5' in info:
+                    f.write(f"MD5: {info['md5']}\n")
+                f.write("\n")
         
         print(f"✓ Checksums saved to {output_file}")
         return True
@@ -135,8 +215,20 @@ def main():
     print("🔧 Generating build metadata and checksums...")
     print(f"Version: {VERSION_DISPLAY}")
     
+    # SHA-256 is always computed for GitHub compatibility; BLAKE3 and MD5
+    # only when explicitly requested, so the metadata fields never depend
+    # on what happens to be installed
+    algs = ('sha256',)
+    if "--include-blake3" in sys.argv[1:]:
+        if blake3 is None:
+            print("Error: --include-blake3 needs the blake3 package (pip install blake3)")
+            sys.exit(1)
+        algs += ('blake3',)
+    if "--include-md5" in sys.argv[1:]:
+        algs += ('md5',)
+    
     # Generate metadata
-    metadata = generate_metadata()
+    metadata = generate_metadata(algs=algs)
     if not metadata:
         sys.exit(1)
     
@@ -4,6 +4,7 @@ Setup script for Mitotic Spindle Tool
 """
 
 from setuptools import setup, find_packages
+from pathlib import Path
 import os
 import sys
 
@@ -11,15 +12,13 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 from version import __version__
 
-# Read the README file
-def read_readme():
-    with open("README.md", "r", encoding="utf-8") as fh:
-        return fh.read()
-
-# Read requirements
-def read_requirements():
-    with open("requirements.txt", "r", encoding="utf-8") as fh:
-        return [line.strip() for line in fh if line.strip() and not line.startswith("#")]
+# Read the README and requirements once each
+long_description = Path("README.md").read_text(encoding="utf-8")
+install_requires = [
+    line.strip()
+    for line in Path("requirements.txt").read_text(encoding="utf-8").splitlines()
+    if line.strip() and not line.startswith("#")
+]
 
 setup(
     name="mitotic-spindle-tool",
@@ -27,7 +26,7 @@ setup(
     author="Kergan Sanderson, Joe Lannan",
     author_email="",
     description="An image analysis Python GUI application for mitotic spindle analysis",
-    long_description=read_readme(),
+    long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/eltinglab/mitotic-spindle-tool",
     packages=find_packages(),
@@ -52,7 +51,7 @@ setup(
         "Topic :: Scientific/Engineering :: Bio-Informatics",
     ],
     python_requires=">=3.8",
-    install_requires=read_requirements(),
+    install_requires=install_requires,
     entry_points={
         "console_scripts": [
             "mitotic-spindle-tool=spindleGUI:main",
@@ -1,41 +1,90 @@
-from numpy import zeros, array, arctan, pi, uint64
-from numpy import sum as npsum
+from numpy import zeros, ones, array, arctan2, pi, nonzero, where, dot
+from numpy import ptp, floor, ceil, fromiter, hypot, argmin, inf, arcsinh
+from numpy import polyfit, argsort, cumsum, bincount, split, unique
+from numpy import maximum as maxarr
+from numpy import minimum as minarr
+from numpy import ascontiguousarray, int32, float32
 from numpy import mean as npmean
 from numpy import sqrt as npsqrt
-from numpy.linalg import norm, eig
-from scipy.ndimage import rotate
-from scipy.integrate import quad
-from scipy.optimize import curve_fit
+from scipy.ndimage import affine_transform, label, maximum_filter
+from scipy.special import cosdg, sindg
+from collections import OrderedDict
+from hashlib import blake2b
 import tiffFunctions as tiffF
 
 # define a constant
 DATA_NAMES = ("Pole Separation (px)", "Arc Length (px)", "Area Metric (px^2)",
              "Max Curvature (px^-1)", "Avg Curvature (px^-1)")
 
-# using thresholded image and main image, return the rotated spindle img
-def getSpindleImg(imageArr, arr):
+# zero border kept around the spindle crop so the bilinear rotation of the
+# crop matches rotating the full image
+CROP_PAD = 2
+
+# the preview and the measurements both segment the same frame, so keep the
+# last few rotated spindle images keyed by a digest of the input arrays
+SPINDLE_CACHE_SIZE = 4
+spindleCache = OrderedDict()
+
+# same result as scipy.ndimage.rotate(img, angle, order=1) for an image of
+# the given shape that is zero except for cropImg placed at (y0, x0), but only
+# the part of the output the crop rotates into is interpolated. Where the crop
+# is not at the image edge it needs a 2 px border of zeros (CROP_PAD)
+def rotateCropped(cropImg, angle, y0, x0, shape):
+
+    # output shape and input/output mapping used by rotate with reshape=True
+    c, s = cosdg(angle), sindg(angle)
+    rotMat = array([[c, s],
+                    [-s, c]])
+    inShape = array(shape)
+    outBounds = rotMat @ [[0, 0, inShape[0], inShape[0]],
+                          [0, inShape[1], 0, inShape[1]]]
+    outShape = (ptp(outBounds, axis=1) + 0.5).astype(int)
+    offset = (inShape - 1) / 2 - rotMat @ ((outShape - 1) / 2)
+
+    # output window that the crop maps into
+    y1, x1 = y0 + cropImg.shape[0], x0 + cropImg.shape[1]
+    corners = array([[y0, y0, y1 - 1, y1 - 1],
+                     [x0, x1 - 1, x0, x1 - 1]])
+    outCorners = rotMat.T @ (corners - offset[:, None])
+    o0 = maxarr(floor(outCorners.min(axis=1)).astype(int) - 1, 0)
+    o1 = minarr(ceil(outCorners.max(axis=1)).astype(int) + 2, outShape)
+
+    rotImg = zeros(outShape, dtype=cropImg.dtype)
+    rotImg[o0[0]:o1[0], o0[1]:o1[1]] = affine_transform(
+        cropImg, rotMat, rotMat @ o0 + offset - [y0, x0],
+        output_shape=tuple(o1 - o0), output=cropImg.dtype, order=1)
+    return rotImg
+
+# using thresholded image and main image, return the rotated spindle img.
+# Results are shared between callers, so the returned array is read-only
+def getSpindleImg(imageArr, threshArr):
+    key = spindleCacheKey(imageArr, threshArr)
+    if key in spindleCache:
+        spindleCache.move_to_end(key)
+        return spindleCache[key]
+
+    rotImg, doesSpindleExist = findSpindleImg(imageArr, threshArr)
+    rotImg.setflags(write=False)
+    spindleCache[key] = rotImg, doesSpindleExist
+    if len(spindleCache) > SPINDLE_CACHE_SIZE:
+        spindleCache.popitem(last=False)
+    return rotImg, doesSpindleExist
 
-    # create identical array for manipulation
-    threshArr = zeros(shape=arr.shape)
-    for i in range(0, len(arr)):
-        for j in range(0, len(arr[i])):
-            threshArr[i,j] = arr[i,j]
-    
-    # count the number of points and preallocate vectors
-    totalPoints = int(npsum(threshArr))
+# digest of the image and threshold contents (and shapes)
+def spindleCacheKey(imageArr, threshArr):
+    digest = blake2b(digest_size=16)
+    for arr in (imageArr, threshArr):
+        arr = ascontiguousarray(arr)
+        digest.update(repr((arr.shape, arr.dtype.str)).encode())
+        digest.update(arr.data)
+    return digest.digest()
 
-    # make these int type to avoid default double assignment later
-    c2 = zeros(totalPoints, dtype=int)
-    r2 = zeros(totalPoints, dtype=int)
-    count = 0
+# segment the spindle and rotate it onto its long axis (uncached)
+def findSpindleImg(imageArr, threshArr):
 
     # list of all x's and y's
-    for r in range(0, len(threshArr)):
-        for c in range(0, len(threshArr[r])):
-            if threshArr[r,c] == 1:
-                r2[count] = r
-                c2[count] = c
-                count += 1
+    r2, c2 = nonzero(threshArr == 1)
+    totalPoints = len(r2)
     
     # Return a white X if there are no points left after thresholding
     if totalPoints == 0:
@@ -44,147 +93,113 @@ def getSpindleImg(imageArr, arr):
     else:
         doesSpindleExist = True
     
-    # CHECK EACH POINT AND SORT INTO OBJECTS
-
-    # start object list with one object
-    tObjects = [thresholdObject(c2[0], r2[0])]
-
-    # go through each image point
-    for i in range(0, len(c2)):
-        noMatch = True
-
-        # go through each existing object
-        o = 0
-        while noMatch and o < len(tObjects):
-
-            # check each point in the object until it finds a neighbor
-            # or goes through all of them
-            j = len(tObjects[o].xCoords) - 1
-            while noMatch and j >= 0:
-
-                # if it finds a neighbor, add it to the object
-                if (abs(tObjects[o].xCoords[j] - c2[i]) <= 2
-                        and abs(tObjects[o].yCoords[j] - r2[i]) <= 2):
-                    tObjects[o].addPoint(c2[i], r2[i])
-                    noMatch = False
-                else:
-                    # go to next point
-                    j -= 1
-            
-            o += 1
-        
-        # if it goes through all objects without a match,
-        # make a new object
-        if noMatch:
-            tObjects.append(thresholdObject(c2[i], r2[i]))
-
-    # CONSOLIDATE OBJECTS
-
-    # this needs to compare every point on an object with every other
-    # point on other objects (not really EVERY point)
+    # SORT POINTS INTO OBJECTS
+
+    # points belong to the same object when they are linked by a chain of
+    # points less than 10 px apart in both x and y. Growing every point into
+    # a 9x9 square makes exactly those squares touch, so labelling the grown
+    # mask gives the objects (the square max filter runs as two 1D passes)
+    grownArr = maximum_filter(threshArr == 1, size=9, mode='constant')
+    labelArr, numObjects = label(grownArr, structure=ones((3, 3), dtype=int))
+
+    # split the points by label in one pass instead of one scan per object
+    pointLabels = labelArr[r2, c2]
+    order = argsort(pointLabels, kind='stable')
+    splits = cumsum(bincount(pointLabels, minlength=numObjects + 1)[1:-1])
+    tObjects = [thresholdObject(xCoords, yCoords) for xCoords, yCoords in
+                zip(split(c2[order], splits), split(r2[order], splits))]
+    
+    # CENTER OF MASS OF EACH OBJECT
+    # (weighted by the image, over the thresholded points of each object)
+    weights = imageArr[r2, c2].astype(float)
+    mass = bincount(pointLabels, weights, numObjects + 1)[1:]
+    xComs = bincount(pointLabels, weights * c2, numObjects + 1)[1:] / mass
+    yComs = bincount(pointLabels, weights * r2, numObjects + 1)[1:] / mass
+    for tObject, xCom, yCom in zip(tObjects, xComs, yComs):
+        tObject.com = [xCom, yCom]
 
     # sort the objects array from most points to least
     tObjects.sort(reverse=True)
-
-    # set startLength != len(tObjects) to enter the loop
-    startLength = len(tObjects) + 1
-
-    while startLength != len(tObjects):
-
-        startLength = len(tObjects)
-
-        o1 = 0
-        while o1 < len(tObjects): # going through objects
-            o2 = o1 + 1
-            
-            while o2 < len(tObjects): # comparing with other objects
-                noMatch = True
-                i = len(tObjects[o1].xCoords) - 1 # every point in o1
-
-                while noMatch and i >= 0:
-                    temp1 = tObjects[o2].xCoords
-                    temp2 = tObjects[o2].yCoords
-                    coordTrunc = ((abs(temp1-tObjects[o1].xCoords[i]) < 10)
-                                * (abs(temp2-tObjects[o1].yCoords[i]) < 10))
-
-                    if sum(coordTrunc) > 0:
-                        # if any o1 points are within a radius of 10 of
-                        # any o2 points, consolidate objects
-                        # remove o2 from tObjects
-                        noMatch = False
-                        tObjects[o1].addPoints(temp1, temp2)
-                        tObjects.pop(o2)
-                    
-                    i -= 1
-                o2 += 1
-            o1 += 1
-    
-    # CENTER OF MASS OF EACH OBJECT
-    for o in range(0, len(tObjects)):
-        mass = uint64(0)
-        xsum = uint64(0)
-        ysum = uint64(0)
-        for i in range(0, tObjects[o].numPoints):
-            yC = tObjects[o].yCoords[i]
-            xC = tObjects[o].xCoords[i]
-            mass += imageArr[yC, xC]
-            ysum += imageArr[yC, xC] * tObjects[o].yCoords[i]
-            xsum += imageArr[yC, xC] * tObjects[o].xCoords[i]
-        tObjects[o].com = [xsum/mass, ysum/mass]
     
     # FIND SPINDLE AUTOMATICALLY
-    xcen = len(threshArr[0]) / 2
-    ycen = len(threshArr) / 2
+    height, width = threshArr.shape
+    xcen = width / 2
+    ycen = height / 2
 
     if len(tObjects) > 1:
-        numPointsArr = [getattr(o, "numPoints") for o in tObjects]
+        numPointsArr = fromiter((o.numPoints for o in tObjects), dtype=int)
         avgObjectSize = npmean(numPointsArr)
 
-        minDist = len(threshArr[0])
-        for o in range(0, len(tObjects)):
-            if (norm(array([xcen, ycen]) 
-                    - array([tObjects[o].com])) < minDist
-                    and tObjects[o].numPoints > avgObjectSize):
-                minDist = norm(array([xcen, ycen])
-                                         - array([tObjects[o].com]))
-                centerObj = o
+        # closest larger-than-average object to the center of the image
+        # (falls back to the largest object if none qualifies)
+        coms = array([o.com for o in tObjects])
+        dists = hypot(coms[:, 0] - xcen, coms[:, 1] - ycen)
+        isCandidate = (numPointsArr > avgObjectSize) & (dists < width)
+        centerObj = argmin(where(isCandidate, dists, inf))
         
         spindle = tObjects[centerObj]
     else:
         spindle = tObjects[0]
     
-    # create array with only the spindle object
-    spindleArr = zeros(threshArr.shape)
-    for i in range(0, spindle.numPoints):
-        spindleArr[spindle.yCoords[i], spindle.xCoords[i]] = 1
-    
-    # multiply original image by the one we just made
-    spindleImg = imageArr * spindleArr
+    # image of only the spindle object, cropped to its bounding box plus a
+    # zero border for the rotation
+    y0 = max(spindle.yCoords.min() - CROP_PAD, 0)
+    x0 = max(spindle.xCoords.min() - CROP_PAD, 0)
+    y1 = min(spindle.yCoords.max() + 1 + CROP_PAD, height)
+    x1 = min(spindle.xCoords.max() + 1 + CROP_PAD, width)
+    spindleImg = zeros((y1 - y0, x1 - x0), dtype=float32)
+    spindleImg[spindle.yCoords - y0, spindle.xCoords - x0] = (
+        imageArr[spindle.yCoords, spindle.xCoords])
 
     # FIND MOMENT OF INERTIA VECTORS
-    Ixx = 0
-    Iyy = 0
-    Ixy = 0
-
-    for y in range(0, len(spindleArr)):
-        for x in range(0, len(spindleArr[y])):
-            Ixx += spindleArr[y,x] * ((x - spindle.com[0]) ** 2)
-            Iyy += spindleArr[y,x] * ((y - spindle.com[1]) ** 2)
-            Ixy += spindleArr[y,x] * (x - spindle.com[0]) * (y - spindle.com[1])
-
-    tensorMat = array([[Ixx, Ixy],
-                          [Ixy, Iyy]])
-
-    # CALCULATE EIGENVECTORS AND ROTATE THE SPINDLE
-    eigenValues, eigenVectors = eig(tensorMat)
-    tempIndex = list(eigenValues).index(min(eigenValues))
-    mainvector = eigenVectors[:,tempIndex]
-
-    rotAngle = - arctan(mainvector[0]/mainvector[1]) * 180 / pi
-    rotImg = rotate(spindleImg, rotAngle, order=1)
+    # (only the spindle points contribute, so sum over their coordinates)
+    dx = spindle.xCoords - spindle.com[0]
+    dy = spindle.yCoords - spindle.com[1]
+    Ixx = dot(dx, dx)
+    Iyy = dot(dy, dy)
+    Ixy = dot(dx, dy)
+
+    # CALCULATE THE PRINCIPAL AXIS AND ROTATE THE SPINDLE
+    # closed form for the long axis of the 2x2 symmetric tensor
+    # [[Ixx, Ixy], [Ixy, Iyy]], kept in [-90, 90) degrees
+    rotAngle = 0.5 * arctan2(2 * Ixy, Ixx - Iyy) * 180 / pi
+    if rotAngle >= 90:
+        rotAngle -= 180
+    rotImg = rotateCropped(spindleImg, rotAngle, y0, x0, threshArr.shape)
     
     return rotImg, doesSpindleExist
 
+# arc length of y = a x^2 + b x + c between x1 and x2
+def parabolaArcLength(a, b, x1, x2):
+    # nearly straight: the closed form below loses precision as a -> 0
+    if abs(a) < 1e-9:
+        return npsqrt(b**2 + 1) * (x2 - x1)
+
+    # with u = 2 a x + b the integrand is sqrt(u^2 + 1) / (2 a)
+    def antiderivative(u):
+        return u * npsqrt(u**2 + 1) + arcsinh(u)
+    return ((antiderivative(2 * a * x2 + b) - antiderivative(2 * a * x1 + b))
+            / (4 * a))
+
+# integral of the signed curvature of y = a x^2 + b x + c from x1 to x2
+def parabolaTotalCurvature(a, b, x1, x2):
+    # the curvature integrates to the change in u / sqrt(u^2 + 1), u = y'
+    def antiderivative(u):
+        return u / npsqrt(u**2 + 1)
+    return antiderivative(2 * a * x2 + b) - antiderivative(2 * a * x1 + b)
+
+# least-squares parabola y = a x^2 + b x + c through the spindle points.
+# polyfit is ill-conditioned with fewer than three distinct columns, so
+# then fall back to a line (two columns) or a flat line (one column)
+def fitSpindleCurve(rotX, rotY):
+    numColumns = len(unique(rotX))
+    if numColumns >= 3:
+        return polyfit(rotX, rotY, 2)
+    if numColumns == 2:
+        b, c = polyfit(rotX, rotY, 1)
+        return 0.0, b, c
+    return 0.0, 0.0, npmean(rotY)
+
 def spindleMeasurements(imageArr, threshArr):
     spindleArray, doesSpindleExist = getSpindleImg(imageArr, threshArr)
 
@@ -193,67 +208,37 @@ def spindleMeasurements(imageArr, threshArr):
         return (0.0, 0.0, 0.0, 0.0, 0.0), doesSpindleExist
 
     # FIT CURVE AND FIND POLES
-    numPoints = int(npsum(spindleArray > 0.0))
-
-    rotX = zeros(numPoints)
-    rotY = zeros(numPoints)
-
-    rotHeight, rotWidth = spindleArray.shape
-
-    count = 0
-    for r in range(0, rotHeight):
-        for c in range(0, rotWidth):
-            if spindleArray[r,c] > 0:
-                rotX[count] = c
-                rotY[count] = r
-                count += 1
+    rotY, rotX = nonzero(spindleArray > 0.0)
     
-    def quadFunc(x, a, b, c):
-        return a * (x ** 2) + b * x + c
-
-    params, covariances  = curve_fit(quadFunc, rotX, rotY)
-    a, b, c = params[0], params[1], params[2]
+    a, b, c = fitSpindleCurve(rotX, rotY)
 
-    minX = min(rotX)
-    maxX = max(rotX)
-
-    leftPole = [minX, quadFunc(minX, a, b, c)]
-    rightPole = [maxX, quadFunc(maxX, a, b, c)]
+    minX = rotX.min()
+    maxX = rotX.max()
 
     # POLE SEPARATION
-    params, covariances = curve_fit(lambda x, a, b: a * x + b, rotX, rotY)
-    a2 = params[0]
-    poleSeparation = npsqrt(a2**2 + 1) * (maxX - minX)
+    # least-squares slope of the points, cov(x, y) / var(x)
+    # (all points in one column have no slope and no separation)
+    if maxX > minX:
+        dx = rotX - npmean(rotX)
+        a2 = dot(dx, rotY) / dot(dx, dx)
+        poleSeparation = npsqrt(a2**2 + 1) * (maxX - minX)
+    else:
+        poleSeparation = 0.0
 
     # ARC LENGTH
-    def arcFunc(t):
-        return npsqrt(4 * a**2 * t**2 + 4 * a * b * t + b**2 + 1)
-    arcLength = quad(arcFunc, minX, maxX)[0]
+    arcLength = parabolaArcLength(a, b, minX, maxX)
     
     # CURVATURE
 
-    # area metric
-    def spindleFunc(x):
-        return a * x**2 + b * x + c
-    
-    x1 = leftPole[0]
-    x2 = rightPole[0]
-    y1 = leftPole[1]
-    y2 = rightPole[1]
-    m1 = (y2 - y1) / (x2 - x1)
-    
-    def poleFunc(x):
-        return m1 * (x - x1) + y1
-    
-    areaCurve = abs(quad(poleFunc, x1, x2)[0] - quad(spindleFunc, x1, x2)[0])
+    # area metric (area between the parabola and the line joining the poles)
+    areaCurve = abs(a) * (maxX - minX) ** 3 / 6
 
     # maximum and average curvature metrics
     maxCurve = abs(2*a)
-    
-    def curvatureFunc(x):
-        return (2 * a) / ((4 * a**2 * x**2 + 4 * a * b * x + b**2 + 1)**(3/2))
-    
-    avgCurve = abs(quad(curvatureFunc, x1, x2)[0] / (x2 - x1))
+    if maxX != minX:
+        avgCurve = abs(parabolaTotalCurvature(a, b, minX, maxX) / (maxX - minX))
+    else:
+        avgCurve = 0.0
 
     # output data
     data = [poleSeparation, arcLength, areaCurve, maxCurve, avgCurve]
@@ -264,29 +249,12 @@ def spindlePlot(imageArr, threshArr):
     spindleArray, doesSpindleExist = getSpindleImg(imageArr, threshArr)
 
     # FIT CURVE AND FIND POLES
-    numPoints = int(npsum(spindleArray > 0.0))
-
-    rotX = zeros(numPoints, dtype=int)
-    rotY = zeros(numPoints, dtype=int)
-
-    rotHeight, rotWidth = spindleArray.shape
-
-    count = 0
-    for r in range(0, rotHeight):
-        for c in range(0, rotWidth):
-            if spindleArray[r,c] > 0:
-                rotX[count] = c
-                rotY[count] = r
-                count += 1
+    rotY, rotX = nonzero(spindleArray > 0.0)
     
-    def quadFunc(x, a, b, c):
-        return a * (x ** 2) + b * x + c
+    a, b, c = fitSpindleCurve(rotX, rotY)
 
-    params, covariances  = curve_fit(quadFunc, rotX, rotY)
-    a, b, c = params[0], params[1], params[2]
-
-    minX = min(rotX)
-    maxX = max(rotX)
+    minX = rotX.min()
+    maxX = rotX.max()
     centerX = (maxX - minX) / 2 + minX
 
     def spindleFunc(x):
@@ -302,11 +270,8 @@ def spindleMeasurementsManual(imageArr, threshArr, leftPole, rightPole):
     """
     Calculate spindle measurements using manually specified pole positions
     """
-    import numpy as np
-    from scipy.integrate import quad
-    
     # POLE SEPARATION (Euclidean distance)
-    poleSeparation = np.sqrt((rightPole[0] - leftPole[0])**2 + 
+    poleSeparation = npsqrt((rightPole[0] - leftPole[0])**2 + 
                            (rightPole[1] - leftPole[1])**2)
     
     # ARC LENGTH (for manual override, approximate as straight line)
@@ -321,72 +286,35 @@ def spindleMeasurementsManual(imageArr, threshArr, leftPole, rightPole):
     
     try:
         # Get spindle pixels for analysis
-        numPoints = int(npsum(spindleArray > 0.0))
+        rotY, rotX = nonzero(spindleArray > 0.0)
         
-        if numPoints == 0:
+        if len(rotX) == 0:
             return [poleSeparation, arcLength, 0.0, 0.0, 0.0], True
         
-        rotX = zeros(numPoints)
-        rotY = zeros(numPoints)
-        
-        rotHeight, rotWidth = spindleArray.shape
-        
-        count = 0
-        for r in range(0, rotHeight):
-            for c in range(0, rotWidth):
-                if spindleArray[r,c] > 0:
-                    rotX[count] = c
-                    rotY[count] = r
-                    count += 1
-        
         # Fit a quadratic curve through the detected pixels
-        def quadFunc(x, a, b, c):
-            return a * (x ** 2) + b * x + c
-        
-        params, covariances = curve_fit(quadFunc, rotX, rotY)
-        a, b, c = params[0], params[1], params[2]
-        
-        # Use manual poles for endpoints but automatic curve for area calculation
-        minX = min(leftPole[0], rightPole[0])
-        maxX = max(leftPole[0], rightPole[0])
+        a, b, c = polyfit(rotX, rotY, 2)
         
         # AREA METRIC (difference between manual line and detected curve)
-        def spindleFunc(x):
-            return a * x**2 + b * x + c
-        
         x1 = leftPole[0]
         x2 = rightPole[0]
         y1 = leftPole[1]
         y2 = rightPole[1]
         
         if x2 != x1:  # Avoid division by zero
-            m1 = (y2 - y1) / (x2 - x1)
-            
-            def poleFunc(x):
-                return m1 * (x - x1) + y1
-            
-            try:
-                areaCurve = abs(quad(poleFunc, x1, x2)[0] - quad(spindleFunc, x1, x2)[0])
-            except:
-                areaCurve = 0.0
+            # exact integrals of the pole line (trapezoid) and the parabola
+            poleIntegral = (y1 + y2) * (x2 - x1) / 2
+            spindleIntegral = (a * (x2**3 - x1**3) / 3 + b * (x2**2 - x1**2) / 2
+                               + c * (x2 - x1))
+            areaCurve = abs(poleIntegral - spindleIntegral)
         else:
             areaCurve = 0.0
         
         # CURVATURE METRICS (based on detected curve, not manual line)
         maxCurve = abs(2*a) if a != 0 else 0.0
         
-        def curvatureFunc(x):
-            if (4 * a**2 * x**2 + 4 * a * b * x + b**2 + 1) > 0:
-                return (2 * a) / ((4 * a**2 * x**2 + 4 * a * b * x + b**2 + 1)**(3/2))
-            else:
-                return 0.0
-        
-        try:
-            if x2 != x1:
-                avgCurve = abs(quad(curvatureFunc, x1, x2)[0] / (x2 - x1))
-            else:
-                avgCurve = 0.0
-        except:
+        if x2 != x1:
+            avgCurve = abs(parabolaTotalCurvature(a, b, x1, x2) / (x2 - x1))
+        else:
             avgCurve = 0.0
         
         # Output data
@@ -417,23 +345,15 @@ def spindlePlotManual(imageArr, threshArr, leftPole, rightPole):
     return (spindleArray, leftPole, rightPole, centerPoint), doesSpindleExist
 
 # a class to represent threshold objects
+# coordinates are stored as contiguous int32 arrays (one per axis)
 class thresholdObject():
 
-    def __init__(self, x0, y0):
+    def __init__(self, xCoords, yCoords):
 
-        self.xCoords = [x0]
-        self.yCoords = [y0]
-        self.numPoints = 1
+        self.xCoords = ascontiguousarray(xCoords, dtype=int32)
+        self.yCoords = ascontiguousarray(yCoords, dtype=int32)
+        self.numPoints = len(self.xCoords)
         self.com = []
     
     def __lt__(self, other):
         return self.numPoints < other.numPoints
-
-    def addPoint(self, xCoord, yCoord):
-        self.xCoords.append(xCoord)
-        self.yCoords.append(yCoord)
-        self.numPoints += 1
-    
-    def addPoints(self, x2s, y2s):
-        for i in range(0, len(x2s)):
-            self.addPoint(x2s[i], y2s[i])
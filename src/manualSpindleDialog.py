@@ -1,13 +1,16 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QPushButton, QHBoxLayout, 
                                QLabel, QCheckBox)
-from PySide6.QtCore import Qt, QPointF, Signal, QTimer
-from PySide6.QtGui import QPainter, QPen, QBrush, QColorConstants, QMouseEvent
+from PySide6.QtCore import Qt, Signal, QTimer
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+from math import hypot
 import numpy as np
 import curveFitData as cFD
 
+# largest side of the image shown behind the poles; bigger images are
+# decimated for display only (measurements always use the full image)
+DISPLAY_MAX_SIDE = 800
+
 class ManualSpindleDialog(QDialog):
     """
     Dialog for manually adjusting spindle pole positions
@@ -37,18 +40,30 @@ class ManualSpindleDialog(QDialog):
             self.left_pole = [width * 0.3, height * 0.5]
             self.right_pole = [width * 0.7, height * 0.5]
         
+        # The automatic curve and its extent are fixed, so compute them once
+        if self.spindle_exists:
+            self.auto_curve = self.fit_auto_curve()
+            self.auto_bounds = self.auto_extent()
+        
+        # Automatic measurements of the same image, computed on first use
+        self.auto_measurements = None
+        
         # Track which pole is being dragged
         self.dragging_pole = None
         self.drag_threshold = 15  # Pixels threshold for drag detection
         
-        # Performance optimization: throttle plot updates during dragging
-        self.update_timer = QTimer()
+        # Performance optimization: coalesce plot updates during dragging.
+        # Mouse moves only record the pole; the zero-delay timer fires once
+        # the pending events are handled, so a burst gives a single redraw
+        self.update_timer = QTimer(self)
         self.update_timer.setSingleShot(True)
         self.update_timer.timeout.connect(self._do_plot_update)
-        self.update_delay_ms = 50  # 50ms delay for smooth updates
+        self.update_delay_ms = 0
         
-        # Flag to prevent redundant updates
+        # Flag to prevent redundant updates, and the state last drawn so
+        # updates that would not change anything are skipped
         self.needs_update = False
+        self.plotted_state = None
         
         # Create matplotlib Figure and Canvas with performance optimizations
         self.figure = Figure(figsize=(8, 6), dpi=100, facecolor='white')
@@ -62,9 +77,13 @@ class ManualSpindleDialog(QDialog):
         self.canvas.mpl_connect('button_press_event', self.on_mouse_press)
         self.canvas.mpl_connect('motion_notify_event', self.on_mouse_move)
         self.canvas.mpl_connect('button_release_event', self.on_mouse_release)
+        self.canvas.mpl_connect('resize_event', self.update_layout)
+        self.canvas.mpl_connect('draw_event', self.on_draw)
         
-        # Cache axes to avoid recreation
+        # Axes and artists are created on the first update and then reused.
+        # background caches the static part of the axes for blitting
         self.ax = None
+        self.background = None
         
         # Setup UI
         self.setup_ui()
@@ -135,86 +154,166 @@ class ManualSpindleDialog(QDialog):
         """Perform the actual plot update"""
         if self.needs_update:
             self.needs_update = False
-            self.update_plot()
+            if self.plot_state() != self.plotted_state:
+                self.update_plot()
+    
+    def plot_state(self):
+        """Everything update_plot depends on that can change"""
+        return (tuple(self.left_pole), tuple(self.right_pole),
+                self.show_auto_checkbox.isChecked())
+    
+    def build_plot(self):
+        """Create the axes, image and artists once; updates only move them"""
+        self.figure.clear()
+        self.ax = self.figure.add_subplot(111)
+        
+        # Configure axes for better performance
+        self.ax.set_aspect('equal')
+        
+        # Display the original image with optimizations. Large images are
+        # decimated to about screen size; the extent keeps the axes in
+        # original pixel coordinates, and each displayed cell shows the
+        # pixel at its centre so the image lines up with the overlays
+        height, width = self.image_arr.shape
+        step = max(1, -(-max(height, width) // DISPLAY_MAX_SIDE))
+        rows = self.cell_centers(height, step)
+        cols = self.cell_centers(width, step)
+        display_arr = self.display_image(self.image_arr[np.ix_(rows, cols)])
+        extent = (-0.5, width - 0.5, height - 0.5, -0.5)
+        self.ax.imshow(display_arr, cmap='gray', vmin=0, vmax=255, aspect='equal',
+                       extent=extent, interpolation='nearest', origin='upper')
+        
+        # Automatic detection (green) never changes, so draw it once and
+        # only toggle its visibility
+        self.auto_artists = []
+        if self.spindle_exists:
+            auto_left = self.auto_data[1]
+            auto_right = self.auto_data[2]
+            
+            # Plot automatic detection curve (green)
+            if self.auto_curve is not None:
+                self.auto_artists += self.ax.plot(*self.auto_curve, 'g-', linewidth=2,
+                                                  alpha=0.7, label='Auto detection')
+            
+            # Plot automatic poles (green)
+            self.auto_artists += self.ax.plot(auto_left[0], auto_left[1], 'go',
+                                              markersize=8, alpha=0.7)
+            self.auto_artists += self.ax.plot(auto_right[0], auto_right[1], 'go',
+                                              markersize=8, alpha=0.7)
+        self.auto_shown = None
+        
+        # Manual curve (blue) and poles (red, draggable), moved by update_plot.
+        # They are animated, so full draws leave them out of the background
+        # and they are blitted on top of it
+        self.manual_line, = self.ax.plot([], [], 'b-', linewidth=2, animated=True,
+                                         label='Manual adjustment')
+        self.left_pole_artist, = self.ax.plot([], [], 'ro', markersize=10, animated=True,
+                                              label='Left pole (draggable)')
+        self.right_pole_artist, = self.ax.plot([], [], 'ro', markersize=10, animated=True,
+                                               label='Right pole (draggable)')
+        self.manual_artists = (self.manual_line, self.left_pole_artist,
+                               self.right_pole_artist)
+        self.limits = None
+        
+        self.ax.set_title('Manual Spindle Pole Adjustment')
+    
+    def cell_centers(self, size, step):
+        """Pixel indices at the centres of ceil(size/step) equal display cells"""
+        count = -(-size // step)
+        return ((np.arange(count) + 0.5) * (size / count)).astype(int)
+
+    def display_image(self, arr):
+        """Scale the image to uint8 once, so drawing it skips normalization"""
+        # range of the full image, so decimation does not change the contrast
+        lowest, highest = float(self.image_arr.min()), float(self.image_arr.max())
+        if highest <= lowest:
+            return np.zeros(arr.shape, dtype=np.uint8)
+        scaled = (arr - lowest) * (255 / (highest - lowest))
+        return scaled.astype(np.uint8)
+    
+    def fit_auto_curve(self):
+        """Sample the automatic detection curve through its poles and center"""
+        auto_left = self.auto_data[1]
+        auto_right = self.auto_data[2]
+        auto_center = self.auto_data[3]
+        
+        if auto_left[0] == auto_right[0]:  # Avoid division by zero
+            return None
+        x_auto = np.linspace(auto_left[0], auto_right[0], 50)  # Reduced points for performance
+        (x0, y0), (x1, y1), (x2, y2) = auto_left, auto_center, auto_right
+        if x1 in (x0, x2):
+            # Fallback to straight line if the center does not define a quadratic
+            y_auto = np.linspace(y0, y2, 50)
+        else:
+            # Lagrange form of the quadratic through the three points
+            y_auto = (y0 * (x_auto - x1) * (x_auto - x2) / ((x0 - x1) * (x0 - x2))
+                      + y1 * (x_auto - x0) * (x_auto - x2) / ((x1 - x0) * (x1 - x2))
+                      + y2 * (x_auto - x0) * (x_auto - x1) / ((x2 - x0) * (x2 - x1)))
+        return x_auto, y_auto
+    
+    def auto_extent(self):
+        """Bounding box (min_x, max_x, min_y, max_y) of the automatic detection"""
+        auto_x_coords = [point[0] for point in self.auto_data[1:4]]
+        auto_y_coords = [point[1] for point in self.auto_data[1:4]]
+        if self.auto_curve is not None:
+            auto_x_coords.extend(self.auto_curve[0].tolist())
+            auto_y_coords.extend(self.auto_curve[1].tolist())
+        return (min(auto_x_coords), max(auto_x_coords),
+                min(auto_y_coords), max(auto_y_coords))
+    
+    def update_legend(self):
+        """Add legend outside the plot area for the visible artists"""
+        handles = [line for line in self.ax.get_lines()
+                   if line.get_visible() and not line.get_label().startswith('_')]
+        self.ax.legend(handles=handles, bbox_to_anchor=(1.05, 1), loc='upper left',
+                       fontsize='small')
+        self.update_layout()
+    
+    def update_layout(self, event=None):
+        """Lay out the figure with extra space for the legend"""
+        if self.ax is not None:
+            self.figure.tight_layout(pad=1.0, rect=[0, 0, 0.85, 1])
+            self.background = None
     
     def update_plot(self):
         """Update the plot with current pole positions"""
         try:
-            # Clear figure but reuse axes if possible for better performance
             if self.ax is None:
-                self.figure.clear()
-                self.ax = self.figure.add_subplot(111)
-            else:
-                self.ax.clear()
-            
-            # Configure axes for better performance
-            self.ax.set_aspect('equal')
-            
-            # Display the original image with optimizations
-            im = self.ax.imshow(self.image_arr, cmap='gray', aspect='equal', 
-                               interpolation='nearest', origin='upper')
+                self.build_plot()
             
             # Pre-calculate coordinates to minimize repeated operations
             all_x_coords = [self.left_pole[0], self.right_pole[0]]
             all_y_coords = [self.left_pole[1], self.right_pole[1]]
             
             # Show automatic detection if enabled and exists
-            if self.show_auto_checkbox.isChecked() and self.spindle_exists:
-                auto_left = self.auto_data[1]
-                auto_right = self.auto_data[2]
-                auto_center = self.auto_data[3]
-                
-                # Add auto coordinates to bounds calculation
-                all_x_coords.extend([auto_left[0], auto_right[0], auto_center[0]])
-                all_y_coords.extend([auto_left[1], auto_right[1], auto_center[1]])
-                
-                # Plot automatic detection curve (green) - optimized
-                if auto_left[0] != auto_right[0]:  # Avoid division by zero
-                    x_auto = np.linspace(auto_left[0], auto_right[0], 50)  # Reduced points for performance
-                    try:
-                        points_x = [auto_left[0], auto_center[0], auto_right[0]]
-                        points_y = [auto_left[1], auto_center[1], auto_right[1]]
-                        coeffs = np.polyfit(points_x, points_y, 2)
-                        y_auto = np.polyval(coeffs, x_auto)
-                        self.ax.plot(x_auto, y_auto, 'g-', linewidth=2, alpha=0.7, label='Auto detection')
-                        all_x_coords.extend(x_auto.tolist())
-                        all_y_coords.extend(y_auto.tolist())
-                    except np.RankWarning:
-                        # Fallback to straight line if quadratic fitting fails
-                        y_auto = np.linspace(auto_left[1], auto_right[1], 50)
-                        self.ax.plot(x_auto, y_auto, 'g-', linewidth=2, alpha=0.7, label='Auto detection')
-                        all_x_coords.extend(x_auto.tolist())
-                        all_y_coords.extend(y_auto.tolist())
-                    except Exception:
-                        # Silent fallback for any other errors
-                        pass
-                
-                # Plot automatic poles (green)
-                self.ax.plot(auto_left[0], auto_left[1], 'go', markersize=8, alpha=0.7)
-                self.ax.plot(auto_right[0], auto_right[1], 'go', markersize=8, alpha=0.7)
+            show_auto = self.show_auto_checkbox.isChecked()
+            full_draw = self.background is None
+            if show_auto != self.auto_shown:
+                full_draw = True
+                self.auto_shown = show_auto
+                for artist in self.auto_artists:
+                    artist.set_visible(show_auto)
+                self.update_legend()
+            if show_auto and self.spindle_exists:
+                all_x_coords.extend(self.auto_bounds[:2])
+                all_y_coords.extend(self.auto_bounds[2:])
             
-            # Plot manual curve (blue) - optimized
+            # Move manual curve (blue), a straight line between the poles
             if self.left_pole and self.right_pole and self.left_pole[0] != self.right_pole[0]:
-                x_manual = np.linspace(self.left_pole[0], self.right_pole[0], 50)  # Reduced points
-                y_manual = np.linspace(self.left_pole[1], self.right_pole[1], 50)
-                self.ax.plot(x_manual, y_manual, 'b-', linewidth=2, label='Manual adjustment')
-                all_x_coords.extend(x_manual.tolist())
-                all_y_coords.extend(y_manual.tolist())
+                self.manual_line.set_data([self.left_pole[0], self.right_pole[0]],
+                                          [self.left_pole[1], self.right_pole[1]])
+            else:
+                self.manual_line.set_data([], [])
             
-            # Plot manual poles (red, draggable)
-            self.ax.plot(self.left_pole[0], self.left_pole[1], 'ro', markersize=10, 
-                        label='Left pole (draggable)')
-            self.ax.plot(self.right_pole[0], self.right_pole[1], 'ro', markersize=10, 
-                        label='Right pole (draggable)')
+            # Move manual poles (red, draggable)
+            self.left_pole_artist.set_data([self.left_pole[0]], [self.left_pole[1]])
+            self.right_pole_artist.set_data([self.right_pole[0]], [self.right_pole[1]])
             
             # Calculate dynamic padding - optimized
             image_height, image_width = self.image_arr.shape
             
-            # Use numpy for faster min/max operations
-            all_x_coords = np.array(all_x_coords)
-            all_y_coords = np.array(all_y_coords)
-            min_x, max_x = np.min(all_x_coords), np.max(all_x_coords)
-            min_y, max_y = np.min(all_y_coords), np.max(all_y_coords)
+            min_x, max_x = min(all_x_coords), max(all_x_coords)
+            min_y, max_y = min(all_y_coords), max(all_y_coords)
             
             # Calculate overflow and padding
             x_overflow_left = max(0, -min_x)
@@ -233,41 +332,66 @@ class ManualSpindleDialog(QDialog):
             padding_bottom = max(y_overflow_bottom, min_padding_y)
             
             # Set axis limits with calculated padding
-            self.ax.set_xlim(-padding_left, image_width + padding_right)
-            self.ax.set_ylim(image_height + padding_bottom, -padding_top)  # Invert Y axis
+            limits = (-padding_left, image_width + padding_right,
+                      image_height + padding_bottom, -padding_top)  # Invert Y axis
+            if limits != self.limits:
+                full_draw = True
+                self.limits = limits
+                self.ax.set_xlim(limits[0], limits[1])
+                self.ax.set_ylim(limits[2], limits[3])
             
-            # Add legend outside the plot area and title
-            self.ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left', fontsize='small')
-            self.ax.set_title('Manual Spindle Pole Adjustment')
-            
-            # Optimize layout and drawing with extra space for legend
-            self.figure.tight_layout(pad=1.0, rect=[0, 0, 0.85, 1])
-            
-            # Force canvas update
-            self.canvas.draw_idle()  # Use draw_idle for better performance
+            # Only the manual artists moved: blit them onto the cached
+            # background, otherwise redraw everything (on_draw re-caches it)
+            if full_draw:
+                self.canvas.draw_idle()
+            else:
+                self.blit_manual_artists()
+            self.plotted_state = self.plot_state()
             
         except Exception as e:
             print(f"Error updating plot: {e}")
             # Fallback: clear everything and show error
             self.figure.clear()
+            self.ax = None
+            self.background = None
+            self.plotted_state = None
             ax = self.figure.add_subplot(111)
             ax.text(0.5, 0.5, f'Plot update error: {str(e)}', 
                    horizontalalignment='center', verticalalignment='center',
                    transform=ax.transAxes, fontsize=12, color='red')
             self.canvas.draw()
     
+    def on_draw(self, event):
+        """Cache the freshly drawn static background and draw the poles on it"""
+        if self.ax is None:
+            return
+        self.background = self.canvas.copy_from_bbox(self.ax.bbox)
+        for artist in self.manual_artists:
+            self.ax.draw_artist(artist)
+    
+    def blit_manual_artists(self):
+        """Redraw only the manual line and poles over the cached background"""
+        self.canvas.restore_region(self.background)
+        for artist in self.manual_artists:
+            self.ax.draw_artist(artist)
+        self.canvas.blit(self.ax.bbox)
+    
     def get_pole_at_position(self, x, y):
         """Check if mouse position is near a pole, return which pole or None"""
         if x is None or y is None:
             return None
             
         try:
-            left_dist = np.sqrt((x - self.left_pole[0])**2 + (y - self.left_pole[1])**2)
-            right_dist = np.sqrt((x - self.right_pole[0])**2 + (y - self.right_pole[1])**2)
+            # Compare squared distances in plain floats (runs per mouse event)
+            threshold_sq = self.drag_threshold * self.drag_threshold
+            dx, dy = x - self.left_pole[0], y - self.left_pole[1]
+            left_dist_sq = dx * dx + dy * dy
+            dx, dy = x - self.right_pole[0], y - self.right_pole[1]
+            right_dist_sq = dx * dx + dy * dy
             
-            if left_dist <= self.drag_threshold:
+            if left_dist_sq <= threshold_sq:
                 return 'left'
-            elif right_dist <= self.drag_threshold:
+            elif right_dist_sq <= threshold_sq:
                 return 'right'
             else:
                 return None
@@ -317,8 +441,8 @@ class ManualSpindleDialog(QDialog):
         """Calculate spindle measurements using manual pole positions"""
         try:
             # POLE SEPARATION (Euclidean distance)
-            pole_separation = np.sqrt((right_pole[0] - left_pole[0])**2 + 
-                                    (right_pole[1] - left_pole[1])**2)
+            pole_separation = hypot(right_pole[0] - left_pole[0],
+                                    right_pole[1] - left_pole[1])
             
             # ARC LENGTH (approximated as straight line for manual adjustment)
             arc_length = pole_separation
@@ -330,8 +454,12 @@ class ManualSpindleDialog(QDialog):
             
             if self.spindle_exists:
                 try:
-                    # Get automatic measurements for comparison
-                    auto_measurements, _ = cFD.spindleMeasurements(self.image_arr, self.thresh_arr)
+                    # Get automatic measurements for comparison (the image
+                    # never changes, so run the detection only once)
+                    if self.auto_measurements is None:
+                        self.auto_measurements, _ = cFD.spindleMeasurements(
+                            self.image_arr, self.thresh_arr)
+                    auto_measurements = self.auto_measurements
                     if auto_measurements:
                         area_metric = auto_measurements[2]  # Use auto area metric
                         # Set minimal curvature since it's a straight line
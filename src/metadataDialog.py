@@ -1,10 +1,67 @@
 from PySide6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QPushButton, 
-                               QTextEdit, QLabel, QScrollArea, QWidget, QTableWidget,
-                               QTableWidgetItem, QHeaderView, QSizePolicy)
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QFont
+                               QLabel, QTableView, QHeaderView, QAbstractItemView)
+from PySide6.QtCore import Qt, QAbstractTableModel
+from PySide6.QtGui import QFont, QBrush
 import tiffFunctions as tiffF
 
+# keys whose values are highlighted in the table
+ERROR_KEYS = frozenset({'error'})
+BOLD_KEYS = frozenset({'size', 'format', 'mode', 'number of frames', 'filename'})
+
+class MetadataModel(QAbstractTableModel):
+    """Read-only (property, value) rows for the metadata table"""
+    
+    HEADERS = ("Property", "Value")
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+        self.styles = []
+        self.bold_font = QFont()
+        self.bold_font.setBold(True)
+        self.error_brush = QBrush(Qt.red)
+    
+    def setRows(self, rows):
+        """Replace all rows, given as (key, value) string pairs"""
+        self.beginResetModel()
+        self.rows = rows
+        
+        # Special formatting for certain types of data, worked out once per
+        # row as (font, brush) for the value column since data() runs on
+        # every repaint
+        self.styles = []
+        for key, _ in rows:
+            lowerKey = key.lower()
+            self.styles.append(
+                (self.bold_font if lowerKey in BOLD_KEYS else None,
+                 self.error_brush if lowerKey in ERROR_KEYS else None))
+        self.endResetModel()
+    
+    def rowCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self.rows)
+    
+    def columnCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else 2
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        key, value = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return value if index.column() else key
+        
+        if index.column() == 1:
+            if role == Qt.FontRole:
+                return self.styles[index.row()][0]
+            if role == Qt.ForegroundRole:
+                return self.styles[index.row()][1]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
 class MetadataDialog(QDialog):
     """Dialog to display TIFF metadata information"""
     
@@ -35,10 +92,11 @@ class MetadataDialog(QDialog):
         title_label.setAlignment(Qt.AlignCenter)
         layout.addWidget(title_label)
         
-        # Create table for metadata
-        self.metadata_table = QTableWidget()
-        self.metadata_table.setColumnCount(2)
-        self.metadata_table.setHorizontalHeaderLabels(["Property", "Value"])
+        # Create table for metadata (a view on a model, so loading sets
+        # all rows at once instead of creating an item per cell)
+        self.metadata_model = MetadataModel(self)
+        self.metadata_table = QTableView()
+        self.metadata_table.setModel(self.metadata_model)
         
         # Configure table appearance
         header = self.metadata_table.horizontalHeader()
@@ -46,8 +104,8 @@ class MetadataDialog(QDialog):
         header.setSectionResizeMode(1, QHeaderView.Stretch)
         
         self.metadata_table.setAlternatingRowColors(True)
-        self.metadata_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.metadata_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.metadata_table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.metadata_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         
         layout.addWidget(self.metadata_table)
         
@@ -74,42 +132,14 @@ class MetadataDialog(QDialog):
         try:
             metadata = tiffF.getTiffMetadata(self.tiff_filename)
             
-            # Clear existing content
-            self.metadata_table.setRowCount(0)
-            
             # Sort metadata keys for better organization
-            sorted_keys = sorted(metadata.keys())
-            
-            # Populate the table
-            for i, key in enumerate(sorted_keys):
-                self.metadata_table.insertRow(i)
-                
-                # Property name
-                key_item = QTableWidgetItem(str(key))
-                key_item.setFont(QFont())
-                self.metadata_table.setItem(i, 0, key_item)
-                
-                # Property value
-                value = metadata[key]
-                value_item = QTableWidgetItem(str(value))
-                
-                # Special formatting for certain types of data
-                if key.lower() in ['error']:
-                    value_item.setForeground(Qt.red)
-                elif key.lower() in ['size', 'format', 'mode', 'number of frames', 'filename']:
-                    font = QFont()
-                    font.setBold(True)
-                    value_item.setFont(font)
-                
-                self.metadata_table.setItem(i, 1, value_item)
-            
-            # Resize table to content
-            self.metadata_table.resizeRowsToContents()
+            rows = [(str(key), str(metadata[key])) for key in sorted(metadata.keys())]
             
         except Exception as e:
             # Show error in table
-            self.metadata_table.setRowCount(1)
-            self.metadata_table.setItem(0, 0, QTableWidgetItem("Error"))
-            error_item = QTableWidgetItem(f"Failed to load metadata: {str(e)}")
-            error_item.setForeground(Qt.red)
-            self.metadata_table.setItem(0, 1, error_item)
+            rows = [("Error", f"Failed to load metadata: {str(e)}")]
+        
+        self.metadata_model.setRows(rows)
+        
+        # Resize table to content (multi-line values such as ImageJ_Info)
+        self.metadata_table.resizeRowsToContents()
@@ -11,7 +11,14 @@ try:
 except ImportError:
     HAS_SEABORN = False
 
+# Characters dropped or replaced when building a filename from a column name
+FILENAME_TABLE = str.maketrans({' ': '_', '(': '', ')': ''})
+
 class PlotDialog(QDialog):
+    # seaborn's style is global (matplotlib rcParams), so it only needs to
+    # be set by the first plot of the session
+    seaborn_style_set = False
+    
     def __init__(self, parent=None, title="Data Plot", image_name=None):
         super().__init__(parent)
         self.setWindowTitle(title)
@@ -23,13 +30,16 @@ class PlotDialog(QDialog):
         self.figure = Figure(figsize=(8, 5), dpi=100)
         self.canvas = FigureCanvas(self.figure)
         
-        # Add toolbar for basic matplotlib interactions
-        self.toolbar = NavigationToolbar(self.canvas, self)
+        # Axes are created by the first plot and cleared for later ones
+        self.ax = None
+        
+        # Toolbar for basic matplotlib interactions, added on first show
+        # (see showEvent) so dialogs that are never displayed skip it
+        self.toolbar = None
         
         # Create layout for canvas and toolbar
-        plot_layout = QVBoxLayout()
-        plot_layout.addWidget(self.toolbar)
-        plot_layout.addWidget(self.canvas)
+        self.plot_layout = QVBoxLayout()
+        self.plot_layout.addWidget(self.canvas)
         
         # Create button layout
         button_layout = QHBoxLayout()
@@ -46,11 +56,18 @@ class PlotDialog(QDialog):
         
         # Main layout
         main_layout = QVBoxLayout()
-        main_layout.addLayout(plot_layout)
+        main_layout.addLayout(self.plot_layout)
         main_layout.addLayout(button_layout)
         
         self.setLayout(main_layout)
     
+    def showEvent(self, event):
+        """Create the navigation toolbar the first time the dialog is shown"""
+        if self.toolbar is None:
+            self.toolbar = NavigationToolbar(self.canvas, self)
+            self.plot_layout.insertWidget(0, self.toolbar)
+        super().showEvent(event)
+    
     def save_plot(self):
         """
         Save the current plot to a file
@@ -59,9 +76,9 @@ class PlotDialog(QDialog):
         if self.image_name:
             base_image_name = os.path.basename(self.image_name)
             base_image_name = os.path.splitext(base_image_name)[0]
-            default_filename = f"{base_image_name}_{self.column_name.replace(' ', '_').replace('(', '').replace(')', '')}.png"
+            default_filename = f"{base_image_name}_{self.column_name.translate(FILENAME_TABLE)}.png"
         else:
-            default_filename = f"spindle_{self.column_name.replace(' ', '_').replace('(', '').replace(')', '')}.png"
+            default_filename = f"spindle_{self.column_name.translate(FILENAME_TABLE)}.png"
         
         file_name, _ = QFileDialog.getSaveFileName(
             self, "Save Plot", default_filename, "Images (*.png *.jpg *.pdf);;All Files (*)")
@@ -83,26 +100,26 @@ class PlotDialog(QDialog):
         # Store column name for save function
         self.column_name = column_name
         
-        # Print debug info
-        print(f"Plotting {column_name} with {len(frames)} data points")
-        print(f"Frames: {frames}")
-        print(f"Values: {data}")
-        
-        # Convert inputs to numpy arrays for safety
-        frames = np.array(frames)
-        data = np.array(data)
+        # Convert inputs to numpy arrays for safety (no copy if they already are)
+        frames = np.asarray(frames)
+        data = np.asarray(data)
         
-        # Clear any previous plot
-        self.figure.clear()
+        # Style first, so the axes pick it up when created or cleared
+        if HAS_SEABORN and not PlotDialog.seaborn_style_set:
+            sns.set_style("whitegrid")
+            PlotDialog.seaborn_style_set = True
         
-        # Create axes
-        ax = self.figure.add_subplot(111)
+        # Clear any previous plot, reusing the axes
+        if self.ax is None:
+            self.ax = self.figure.add_subplot(111)
+        else:
+            self.ax.cla()
+        ax = self.ax
         
         # Check if we have valid data
         if len(frames) > 0 and len(data) > 0:
             # Check if seaborn is available for enhanced visuals
             if HAS_SEABORN:
-                sns.set_style("whitegrid")
                 sns.lineplot(x=frames, y=data, ax=ax, marker='o')
             else:
                 ax.plot(frames, data, marker='o', linestyle='-')
@@ -122,5 +139,6 @@ class PlotDialog(QDialog):
         # Add tight layout
         self.figure.tight_layout()
         
-        # Refresh canvas
-        self.canvas.draw()
+        # Refresh canvas (deferred to the event loop, so repeated calls
+        # are drawn once)
+        self.canvas.draw_idle()
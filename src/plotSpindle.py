@@ -1,7 +1,6 @@
 from PySide6.QtGui import QPainter, QPainterPath, QColorConstants, QPen
-from PySide6.QtCore import QPoint, QPointF
+from PySide6.QtCore import Qt, QPoint, QPointF
 import tiffFunctions as tiffF
-from numpy import zeros
 
 # used for plotting the results of the curve fit onto the preview pixmap
 def plotSpindle(fitResults, doesSpindleExist):
@@ -16,13 +15,6 @@ def plotSpindle(fitResults, doesSpindleExist):
 
     # skip all of this code if I decide to set the scale back to 1
     if sF > 1:
-        height, width = spindleArray.shape
-        bigSpindleArray = zeros((height * sF, width * sF))
-        for y in range(height):
-            for x in range(width):
-                bigSpindleArray[sF * y : sF * y + sF,
-                                sF * x : sF * x + sF] = spindleArray[y, x]
-        
         # scale up coordinate values
         leftPole = (leftPole[0] * sF, leftPole[1] * sF)
         rightPole = (rightPole[0] * sF, rightPole[1] * sF)
@@ -30,38 +22,21 @@ def plotSpindle(fitResults, doesSpindleExist):
 
     controlPoint = calculateBezierPoint(leftPole, centerPoint, rightPole)
 
+    # convert at the original size, then let Qt enlarge each pixel into an
+    # sF x sF block (nearest neighbour)
+    spindlePix = tiffF.pixFromArr(spindleArray)
     if sF > 1:
-        spindlePix = tiffF.pixFromArr(bigSpindleArray)
-    else:
-        spindlePix = tiffF.pixFromArr(spindleArray)
+        height, width = spindleArray.shape
+        spindlePix = spindlePix.scaled(width * sF, height * sF,
+                                       Qt.IgnoreAspectRatio, Qt.FastTransformation)
 
     # if there is no spindle, don't try to plot
     if not doesSpindleExist:
         return spindlePix
 
-    # draw the fit line
-    painter = QPainter()
-    painter.begin(spindlePix)
-    painter.setOpacity(0.5)
-    path = QPainterPath(QPointF(leftPole[0], leftPole[1]))
-    path.quadTo(controlPoint[0], controlPoint[1], rightPole[0], rightPole[1])
-    pen = QPen(QColorConstants.Red)
-    pen.setWidth(2 * sF)
-    painter.setPen(pen)
-    painter.drawPath(path)
-    painter.end()
-
-    # draw the poles
-    painter = QPainter()
-    painter.begin(spindlePix)
-    pointRadius = 3 * sF
-    painter.setPen(QColorConstants.Red)
-    painter.setBrush(QColorConstants.Red)
-    painter.drawEllipse(QPoint(int(leftPole[0]), int(leftPole[1])),
-                        pointRadius, pointRadius)
-    painter.drawEllipse(QPoint(int(rightPole[0]), int(rightPole[1])),
-                        pointRadius, pointRadius)
-    painter.end()
+    # draw the fit line half transparent and the poles opaque
+    drawFit(spindlePix, leftPole, controlPoint, rightPole, sF,
+            QColorConstants.Red, 0.5, 1.0)
 
     return spindlePix
 
@@ -91,30 +66,39 @@ def plotSpindleOnOriginal(originalImageArr, fitResults, doesSpindleExist):
     # Calculate the control point for the Bezier curve
     controlPoint = calculateBezierPoint(leftPole, centerPoint, rightPole)
     
-    # Draw the fit line on the original image
-    painter = QPainter()
-    painter.begin(originalPix)
-    painter.setOpacity(0.7)  # Make slightly more visible on original image
+    # Draw the fit line on the original image, yellow for better visibility
+    # and slightly more opaque
+    drawFit(originalPix, leftPole, controlPoint, rightPole, sF,
+            QColorConstants.Yellow, 0.7, 0.7)
     
-    # Draw the Bezier curve
+    return originalPix
+
+# draw the fitted curve (a quadratic Bezier from the left to the right pole)
+# and the two poles onto a pixmap, with line width and pole size scaled by sF
+def drawFit(pix, leftPole, controlPoint, rightPole, sF, color,
+            curveOpacity, poleOpacity):
+    painter = QPainter()
+    painter.begin(pix)
+
+    # draw the fit line
+    painter.setOpacity(curveOpacity)
     path = QPainterPath(QPointF(leftPole[0], leftPole[1]))
     path.quadTo(controlPoint[0], controlPoint[1], rightPole[0], rightPole[1])
-    pen = QPen(QColorConstants.Yellow)  # Use yellow for better visibility on original
+    pen = QPen(color)
     pen.setWidth(2 * sF)
     painter.setPen(pen)
     painter.drawPath(path)
-    
-    # Draw the poles
+
+    # draw the poles
+    painter.setOpacity(poleOpacity)
     pointRadius = 3 * sF
-    painter.setPen(QColorConstants.Yellow)
-    painter.setBrush(QColorConstants.Yellow)
+    painter.setPen(color)
+    painter.setBrush(color)
     painter.drawEllipse(QPoint(int(leftPole[0]), int(leftPole[1])),
-                    pointRadius, pointRadius)
+                        pointRadius, pointRadius)
     painter.drawEllipse(QPoint(int(rightPole[0]), int(rightPole[1])),
-                    pointRadius, pointRadius)
+                        pointRadius, pointRadius)
     painter.end()
-    
-    return originalPix
 
 def calculateBezierPoint(lP, cP, rP):
 
@@ -123,7 +107,7 @@ def calculateBezierPoint(lP, cP, rP):
     # we have P, P1, and P3, and we want to know P2, so
     # P2 = ( P - (1-t)^2 * P1 - t^2 * P3 ) / ( 2(1-t)t )
     # where t is 1/2 when you have the center point P of a quadratic
-    # P2 = 2 * P - (P1 + P2) / 2
+    # P2 = 2 * P - (P1 + P3) / 2
     # lP is left (P1), cP is center (P), rP is right (P3)
 
     x = 2 * cP[0] - (lP[0] + rP[0]) / 2
@@ -63,18 +63,48 @@ try:
 except ImportError as e:
     print(f"[WARNING] Could not import module: {e}")
 
-import os
 from numpy import zeros, arange
-import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-try:
-    import seaborn as sns
-    HAS_SEABORN = True
-except ImportError:
-    HAS_SEABORN = False
+
+# marker for a stretch item in vbox/hbox
+STRETCH = None
+
+# lay out items in a box layout on a new widget
+# items are widgets, (widget, alignment) or (widget, stretch) tuples,
+# ints for fixed spacing or STRETCH
+def _boxWidget(layout, items, margins):
+    if margins is not None:
+        layout.setContentsMargins(margins, margins, margins, margins)
+    for item in items:
+        if item is STRETCH:
+            layout.addStretch()
+        elif isinstance(item, int):
+            layout.addSpacing(item)
+        elif isinstance(item, tuple):
+            widget, option = item
+            if isinstance(option, Qt.AlignmentFlag):
+                layout.addWidget(widget, alignment=option)
+            else:
+                layout.addWidget(widget, stretch=option)
+        else:
+            layout.addWidget(item)
+    widget = QWidget()
+    widget.setLayout(layout)
+    return widget
+
+def vbox(*items, margins=None):
+    return _boxWidget(QVBoxLayout(), items, margins)
+
+def hbox(*items, margins=None):
+    return _boxWidget(QHBoxLayout(), items, margins)
+
+# lay out (widget, row, column, ...) cells in a grid on a new widget
+def grid(*cells):
+    layout = QGridLayout()
+    for cell in cells:
+        layout.addWidget(*cell)
+    widget = QWidget()
+    widget.setLayout(layout)
+    return widget
 
 # subclass QMainWindow to create a custom MainWindow
 class MainWindow(QMainWindow):
@@ -228,102 +258,57 @@ class MainWindow(QMainWindow):
         # based off of QButton with the text "Toss Frame Data"
         defaultSize = QPushButton("Toss Frame Data").sizeHint()
 
-        # create container widgets and layouts
-        centralWidget = QWidget()
-        leftWidget = QWidget()
-        importWidget = QWidget()
-        thresholdWidget = QWidget()
-        bottomLeftWidget = QWidget()
-        imageWidget = QWidget()
-        thresholdImageWidget = QWidget()
-        previewImageWidget = QWidget()
-        dataTableWidget = QWidget()
+        # build the widget hierarchy bottom-up
+        spacing = defaultSize.height()
 
         dividingLine = QFrame()
         dividingLine.setFrameStyle(QFrame.VLine | QFrame.Raised)
 
-        imageWidgets = (imageWidget, thresholdImageWidget, previewImageWidget)
+        importWidget = grid(
+            (self.importLabel, 0, 0),
+            (self.tiffButton, 0, 1),
+            (self.metadataButton, 1, 0, 1, 2))  # Span across both columns
+
+        thresholdWidget = grid(
+            (self.totalFrameLabel, 0, 0),
+            (self.totalFrameValue, 0, 1, Qt.AlignRight),
+            (self.frameLabel, 1, 0),
+            (self.frameValue, 1, 1),
+            (self.threshLabel, 2, 0),
+            (self.threshValue, 2, 1),
+            (self.gOLIterationsLabel, 3, 0),
+            (self.gOLIterationsValue, 3, 1),
+            (self.gOLFactorLabel, 4, 0),
+            (self.gOLFactorValue, 4, 1))
+
+        bottomLeftWidget = grid(
+            (self.addButton, 0, 0),
+            (self.tossButton, 0, 1),
+            (self.previewButton, 1, 0),
+            (self.manualButton, 1, 1),
+            (self.runAllFramesButton, 2, 0),
+            (self.exportButton, 2, 1))
 
-        tempImageWidget = QWidget()
-        tempHorizontal = QHBoxLayout()
-        tempVertical = QVBoxLayout()
-        tempGrid = QGridLayout()
-        
         # place widgets in the app
-        tempVertical.addWidget(importTitle)
-        tempGrid.addWidget(self.importLabel, 0, 0)
-        tempGrid.addWidget(self.tiffButton, 0, 1)
-        tempGrid.addWidget(self.metadataButton, 1, 0, 1, 2)  # Span across both columns
-        importWidget.setLayout(tempGrid)
-        tempGrid = QGridLayout()
-        tempVertical.addWidget(importWidget)
-
-        tempVertical.addSpacing(defaultSize.height())
-        tempVertical.addWidget(thresholdTitle)
-        tempGrid.addWidget(self.totalFrameLabel, 0, 0)
-        tempGrid.addWidget(self.totalFrameValue, 0, 1, Qt.AlignRight)
-        tempGrid.addWidget(self.frameLabel, 1, 0)
-        tempGrid.addWidget(self.frameValue, 1, 1)
-        tempGrid.addWidget(self.threshLabel, 2, 0)
-        tempGrid.addWidget(self.threshValue, 2, 1)
-        tempGrid.addWidget(self.gOLIterationsLabel, 3, 0)
-        tempGrid.addWidget(self.gOLIterationsValue, 3, 1)
-        tempGrid.addWidget(self.gOLFactorLabel, 4, 0)
-        tempGrid.addWidget(self.gOLFactorValue, 4, 1)
-        thresholdWidget.setLayout(tempGrid)
-        tempGrid = QGridLayout()
-        tempVertical.addWidget(thresholdWidget)
-
-        tempVertical.addSpacing(defaultSize.height())
-        tempVertical.addWidget(dataTitle)
-        tempGrid.addWidget(self.addButton, 0, 0)
-        tempGrid.addWidget(self.tossButton, 0, 1)
-        tempGrid.addWidget(self.previewButton, 1, 0)
-        tempGrid.addWidget(self.manualButton, 1, 1)
-        tempGrid.addWidget(self.runAllFramesButton, 2, 0)
-        tempGrid.addWidget(self.exportButton, 2, 1)
-        bottomLeftWidget.setLayout(tempGrid)
-        tempVertical.addWidget(bottomLeftWidget)
-        tempVertical.addWidget(self.hotkeysLabel)
-        tempVertical.addStretch()
-        tempVertical.addWidget(versionLabel)
-        tempGrid = QGridLayout()
-        leftWidget.setLayout(tempVertical)
-        tempVertical = QVBoxLayout()
-
-        for i in range(len(imageLabels)):
-            tempVertical.addWidget(imageLabels[i],
-                               alignment=Qt.AlignLeft | Qt.AlignBottom)
-            tempHorizontal.setContentsMargins(0,0,0,0)
-            tempHorizontal.addWidget(imagePixLabels[i], alignment=Qt.AlignLeft)
-            tempImageWidget.setLayout(tempHorizontal)
-            tempHorizontal = QHBoxLayout()
-            tempVertical.addWidget(tempImageWidget)
-            tempImageWidget = QWidget()
-            tempVertical.addStretch()
-            imageWidgets[i].setLayout(tempVertical)
-            tempVertical = QVBoxLayout()
-            imageSplitter.addWidget(imageWidgets[i])
-        
-        imageSplitterWidget = QWidget()
-        tempVertical.addWidget(imagesTitle)
-        tempVertical.addWidget(imageSplitter)
-        tempVertical.addStretch()
-        imageSplitterWidget.setLayout(tempVertical)
-        tempVertical = QVBoxLayout()
-        tempVertical.addWidget(tableTitle)
-        tempVertical.addWidget(self.dataTableView)
-        dataTableWidget.setLayout(tempVertical)
-        tempVertical = QVBoxLayout()
+        leftWidget = vbox(
+            importTitle, importWidget, spacing,
+            thresholdTitle, thresholdWidget, spacing,
+            dataTitle, bottomLeftWidget, self.hotkeysLabel,
+            STRETCH, versionLabel)
+
+        for imageLabel, imagePixLabel in zip(imageLabels, imagePixLabels):
+            imageSplitter.addWidget(vbox(
+                (imageLabel, Qt.AlignLeft | Qt.AlignBottom),
+                hbox((imagePixLabel, Qt.AlignLeft), margins=0),
+                STRETCH))
+
+        imageSplitterWidget = vbox(imagesTitle, imageSplitter, STRETCH)
+        dataTableWidget = vbox(tableTitle, self.dataTableView)
 
         rightSplitter.addWidget(imageSplitterWidget)
         rightSplitter.addWidget(dataTableWidget)
 
-        tempHorizontal.addWidget(leftWidget)
-        tempHorizontal.addWidget(dividingLine)
-        tempHorizontal.addWidget(rightSplitter, stretch=1)
-        centralWidget.setLayout(tempHorizontal)
-        tempHorizontal = QHBoxLayout()
+        centralWidget = hbox(leftWidget, dividingLine, (rightSplitter, 1))
 
         self.setCentralWidget(centralWidget)
 
@@ -652,6 +637,9 @@ class MainWindow(QMainWindow):
     def _export_csv(self, fileName):
         """Export data in CSV format"""
         try:
+            # pandas is only needed for exporting, so import it on demand
+            import pandas as pd
+            
             # Create DataFrame with measurement data
             df = pd.DataFrame(self.dataTableArray, columns=cFD.DATA_NAMES)
             
@@ -672,6 +660,9 @@ class MainWindow(QMainWindow):
     def _export_excel(self, fileName):
         """Export data in Excel format with multiple sheets"""
         try:
+            # pandas is only needed for exporting, so import it on demand
+            import pandas as pd
+            
             # Create DataFrame with measurement data
             df = pd.DataFrame(self.dataTableArray, columns=cFD.DATA_NAMES)
             
@@ -25,21 +25,15 @@ def arrFromTiff(tiffFileName, frameNum):
 
 # creates a normalized QPixmap from a numpy array
 def pixFromArr(arr):
-    # normalize the array
-    temp = zeros(arr.shape, dtype = uint8)
-    lowest = 100000
-    highest = 0
-    for i in range(0, arr.shape[0]):
-        for j in range(0, arr.shape[1]):
-            if arr[i][j] < lowest:
-                lowest = arr[i][j]
-            if arr[i][j] > highest:
-                highest = arr[i][j]
-
-    for i in range(0, arr.shape[0]):
-        for j in range(0, arr.shape[1]):        
-            temp[i][j] = int(255 *
-                    ( (arr[i][j] - lowest) / (highest - lowest) ))
+    # normalize the array: the range starts at (100000, 0) and widens to
+    # the array's min and max, then values are scaled to 0-255 and truncated
+    lowest = arr.min()
+    if not lowest < 100000:
+        lowest = 100000
+    highest = arr.max()
+    if not highest > 0:
+        highest = 0
+    temp = (255 * ((arr - lowest) / (highest - lowest))).astype(uint8)
 
     im = Image.fromarray(temp)
     im = ImageQt.ImageQt(im)
@@ -0,0 +1,50 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir, "src"))
+import curveFitData as cfd
+
+
+# thresholded spindles too small for a parabola fit must still give finite,
+# flat measurements instead of NaN
+class DegenerateSpindleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.imageArr = np.random.default_rng(0).random((60, 60)) * 100
+
+    def measure(self, threshArr):
+        data, doesSpindleExist = cfd.spindleMeasurements(self.imageArr,
+                                                         threshArr)
+        self.assertTrue(doesSpindleExist)
+        self.assertTrue(np.all(np.isfinite(data)), data)
+        return data
+
+    def test_single_pixel(self):
+        threshArr = np.zeros((60, 60))
+        threshArr[30, 30] = 1
+        self.assertEqual(list(self.measure(threshArr)), [0.0] * 5)
+
+    def test_single_column(self):
+        threshArr = np.zeros((60, 60))
+        threshArr[20:40, 30] = 1
+        poleSeparation, arcLength = self.measure(threshArr)[:2]
+        self.assertAlmostEqual(poleSeparation, 19.0)
+        self.assertAlmostEqual(arcLength, 19.0)
+
+    def test_two_column_fit_is_a_line(self):
+        a, b, c = cfd.fitSpindleCurve(np.array([30, 31, 31]),
+                                      np.array([10, 11, 13]))
+        self.assertEqual(a, 0.0)
+        self.assertAlmostEqual(b, 2.0)
+        self.assertAlmostEqual(c, -50.0)
+
+    def test_single_column_fit_is_flat(self):
+        a, b, c = cfd.fitSpindleCurve(np.array([30, 30]), np.array([10, 12]))
+        self.assertEqual((a, b, c), (0.0, 0.0, 11.0))
+
+
+if __name__ == "__main__":
+    unittest.main()